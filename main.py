@@ -20,13 +20,19 @@ def parse_args() -> argparse.Namespace:
         default=Path(__file__).parent,
         help="Path to the project root where raw data files are located.",
     )
+    parser.add_argument(
+        "--output-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="File format used for the processed datasets.",
+    )
     return parser.parse_args()
 
 
-def run_etl(project_root: Path) -> Dict[str, DatasetResult]:
+def run_etl(project_root: Path, output_format: str = "csv") -> Dict[str, DatasetResult]:
     """Runs the ETL pipeline and returns the processed datasets."""
 
-    config = ETLConfig.build_default(project_root)
+    config = ETLConfig.build_default(project_root, output_format=output_format)
     pipeline = ETLPipeline(config)
     results = pipeline.run()
 
@@ -44,7 +50,7 @@ def run_etl(project_root: Path) -> Dict[str, DatasetResult]:
 
 def main() -> None:
     args = parse_args()
-    run_etl(project_root=args.project_root)
+    run_etl(project_root=args.project_root, output_format=args.output_format)
 
 
 if __name__ == "__main__":
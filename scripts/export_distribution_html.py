@@ -1,44 +1,261 @@
 from __future__ import annotations
 
-import json
+import gzip
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
+from string import Template
+from typing import BinaryIO, Callable, Iterable
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = Path(__file__).resolve()
+PROJECT_ROOT = SCRIPT_PATH.parents[1]
 DATA_DIR = PROJECT_ROOT / "data" / "processed"
 DISTRIBUTION_OUTPUT_PATH = PROJECT_ROOT / "docs" / "distribution_explorer.html"
 TIME_SERIES_OUTPUT_PATH = PROJECT_ROOT / "docs" / "time_series_view.html"
 COMPARISON_OUTPUT_PATH = PROJECT_ROOT / "docs" / "comparison_dashboard.html"
 SECTOR_OUTPUT_PATH = PROJECT_ROOT / "docs" / "sector_overview.html"
 SIZE_OUTPUT_PATH = PROJECT_ROOT / "docs" / "size_distribution.html"
+WRITE_BUFFER_SIZE = 1 << 20
+GZIP_LEVEL = 6
+JSON_ENCODER = PlotlyJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+BIN_RANGE_HOVER = "%{customdata[0]:.1~f}–%{customdata[1]:.1~f}"
+YEAR_DTYPES = {"year": "Int64", "installations": "Int64", "companies": "Int64"}
+SIZE_DTYPES = {"company_size": "string", "companies": "Int64", "installations": "Int64"}
+SECTOR_DTYPES = {"sector": "string", "installations": "Int64"}
+TIME_SERIES_DTYPES = {
+    "year": "Int64",
+    "companies_adhesion": "Int64",
+    "companies_certification": "Int64",
+}
+SECTOR_RENAMES = {
+    "Agricultura, ganadería, pesca y silvicultura": "Agro, pesca y silvicultura",
+}
+PLOTLY_SCRIPT = '<script src="https://cdn.plot.ly/plotly-2.30.0.min.js"></script>'
+BASE_STYLES = """        body { font-family: "Segoe UI", Tahoma, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 24px; border-radius: 16px; box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1); }
+        h1 { text-align: center; margin-bottom: 16px; }
+"""
+PAGE_HEADER = Template(
+    """<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="utf-8" />
+    <title>$title</title>
+    """
+    + PLOTLY_SCRIPT
+    + """
+    <style>
+"""
+    + BASE_STYLES
+    + """$styles    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>$heading</h1>
+        <div class="controls">
+$controls
+        </div>
+        <div id="$chart_id"></div>
+    </div>
+    <script>
+"""
+)
+PAGE_FOOTER = b"""    </script>
+</body>
+</html>
+"""
+ARTIFACT_INPUTS = {
+    DISTRIBUTION_OUTPUT_PATH: [
+        DATA_DIR / "adhesion_by_year.csv",
+        DATA_DIR / "certification_by_year.csv",
+        DATA_DIR / "adhesion_by_size.csv",
+    ],
+    TIME_SERIES_OUTPUT_PATH: [DATA_DIR / "yearly_summary.csv"],
+    COMPARISON_OUTPUT_PATH: [
+        DATA_DIR / "yearly_summary.csv",
+        DATA_DIR / "adhesion_by_size.csv",
+    ],
+    SECTOR_OUTPUT_PATH: [
+        DATA_DIR / "adhesion_by_sector.csv",
+        DATA_DIR / "certification_by_sector.csv",
+    ],
+    SIZE_OUTPUT_PATH: [DATA_DIR / "adhesion_by_size.csv"],
+}
+
+
+def _open_html(path: Path) -> BinaryIO:
+    return path.open("wb", buffering=WRITE_BUFFER_SIZE)
+
+
+def _write_page(
+    path: Path,
+    *,
+    title: str,
+    heading: str,
+    styles: str,
+    controls: str,
+    chart_id: str,
+    constants: dict[str, object],
+    script: str,
+) -> None:
+    with _open_html(path) as handle:
+        handle.write(
+            PAGE_HEADER.substitute(
+                title=title,
+                heading=heading,
+                styles=styles,
+                controls=controls,
+                chart_id=chart_id,
+            ).encode("utf-8")
+        )
+        _write_constants(handle, constants)
+        handle.write(script.encode("utf-8"))
+        handle.write(PAGE_FOOTER)
+    _write_gzip_copy(path)
+
+
+def _gzip_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.gz")
+
+
+def _write_gzip_copy(path: Path) -> None:
+    with path.open("rb") as source, gzip.GzipFile(
+        _gzip_path(path), "wb", compresslevel=GZIP_LEVEL, mtime=0
+    ) as target:
+        shutil.copyfileobj(source, target, WRITE_BUFFER_SIZE)
+
+
+def _write_constants(handle: BinaryIO, constants: dict[str, object]) -> None:
+    for name, value in constants.items():
+        handle.write(f"        const {name} = ".encode("utf-8"))
+        for chunk in JSON_ENCODER.iterencode(value):
+            handle.write(chunk.encode("utf-8"))
+        handle.write(b";\n")
+
+
+def _fingerprint(paths: Iterable[Path]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _fingerprint_path(output: Path) -> Path:
+    return output.with_name(f"{output.name}.fp")
+
+
+def _is_up_to_date(output: Path, fingerprint: str) -> bool:
+    fingerprint_path = _fingerprint_path(output)
+    return (
+        output.exists()
+        and _gzip_path(output).exists()
+        and fingerprint_path.exists()
+        and fingerprint_path.read_text(encoding="utf-8") == fingerprint
+    )
+
+
+def _write_artifact(
+    writer: Callable[[Path], None], output: Path, fingerprint: str
+) -> None:
+    writer(output)
+    _fingerprint_path(output).write_text(fingerprint, encoding="utf-8")
+
+
+def _read_typed_csv(path: Path, dtypes: dict[str, str]) -> pd.DataFrame:
+    return pd.read_csv(path, usecols=list(dtypes), dtype=dtypes)
 
 
 def load_distribution_sources() -> dict[str, pd.DataFrame]:
     return {
-        "Adhesión anual": pd.read_csv(DATA_DIR / "adhesion_by_year.csv"),
-        "Certificación anual": pd.read_csv(DATA_DIR / "certification_by_year.csv"),
-        "Tamaño de empresa": pd.read_csv(DATA_DIR / "adhesion_by_size.csv"),
+        "Adhesión anual": _read_typed_csv(
+            DATA_DIR / "adhesion_by_year.csv", YEAR_DTYPES
+        ).fillna(0),
+        "Certificación anual": _read_typed_csv(
+            DATA_DIR / "certification_by_year.csv", YEAR_DTYPES
+        ).fillna(0),
+        "Tamaño de empresa": _read_typed_csv(DATA_DIR / "adhesion_by_size.csv", SIZE_DTYPES),
     }
 
 
+def _normalize_size_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    if frame.attrs.get("_normalized"):
+        return frame
+
+    normalized = frame.assign(
+        companies=pd.to_numeric(frame["companies"], errors="coerce").fillna(0).astype(int),
+        installations=(
+            pd.to_numeric(frame["installations"], errors="coerce").fillna(0).astype(int)
+        ),
+    )
+    size_order = (
+        normalized.sort_values("companies", ascending=False)["company_size"].unique()
+    )
+    normalized["company_size"] = pd.Categorical(
+        normalized["company_size"], categories=size_order, ordered=True
+    )
+    normalized.attrs["_normalized"] = True
+    return normalized
+
+
 def load_sector_summary() -> pd.DataFrame:
-    adhesion = pd.read_csv(DATA_DIR / "adhesion_by_sector.csv").assign(dataset="Adhesión")
-    certification = (
-        pd.read_csv(DATA_DIR / "certification_by_sector.csv").assign(dataset="Certificación")
+    adhesion = _read_typed_csv(DATA_DIR / "adhesion_by_sector.csv", SECTOR_DTYPES).assign(
+        dataset="Adhesión"
     )
+    certification = _read_typed_csv(
+        DATA_DIR / "certification_by_sector.csv", SECTOR_DTYPES
+    ).assign(dataset="Certificación")
     combined = pd.concat([adhesion, certification], ignore_index=True)
-    combined["sector"] = combined["sector"].astype(str).str.strip()
-    combined["installations"] = (
-        pd.to_numeric(combined["installations"], errors="coerce").fillna(0).astype(int)
+    sector = combined["sector"].str.strip()
+    combined["sector"] = sector.map(SECTOR_RENAMES).fillna(sector)
+    combined["installations"] = combined["installations"].fillna(0)
+    combined["sector"] = combined["sector"].astype("category")
+    combined["dataset"] = combined["dataset"].astype("category")
+    return combined
+
+
+def _observed(values: pd.Series) -> np.ndarray:
+    return values.dropna().to_numpy(float)
+
+
+def _histogram_edges(values: pd.Series) -> np.ndarray:
+    return np.histogram_bin_edges(_observed(values), bins=10)
+
+
+def _histogram_trace(values: pd.Series, edges: np.ndarray, **trace_options: object) -> go.Bar:
+    counts, _ = np.histogram(_observed(values), bins=edges)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        **trace_options,
     )
-    combined["sector"] = combined["sector"].str.replace(
-        "Agricultura, ganadería, pesca y silvicultura",
-        "Agro, pesca y silvicultura",
-        regex=False,
+
+
+def _box_trace(values: pd.Series, **trace_options: object) -> go.Box:
+    data = _observed(values)
+    if data.size == 0:
+        return go.Box(boxpoints=False, **trace_options)
+    q1, median, q3 = np.percentile(data, [25, 50, 75])
+    reach = 1.5 * (q3 - q1)
+    inliers = data[(data >= q1 - reach) & (data <= q3 + reach)]
+    return go.Box(
+        q1=[q1],
+        median=[median],
+        q3=[q3],
+        lowerfence=[inliers.min()],
+        upperfence=[inliers.max()],
+        boxpoints=False,
+        **trace_options,
     )
-    return combined
 
 
 def build_figures(datasets: dict[str, pd.DataFrame]) -> dict[str, dict[str, dict[str, object]]]:
@@ -51,8 +268,7 @@ def build_figures(datasets: dict[str, pd.DataFrame]) -> dict[str, dict[str, dict
 
     for name, frame in datasets.items():
         if name in {"Adhesión anual", "Certificación anual"}:
-            normalized = frame.copy()
-            normalized = normalized.rename(
+            normalized = frame.rename(
                 columns={
                     "year": "Año",
                     "installations": "Instalaciones",
@@ -65,110 +281,100 @@ def build_figures(datasets: dict[str, pd.DataFrame]) -> dict[str, dict[str, dict
                 var_name="Indicador",
                 value_name="Valor",
             )
-            hist = px.histogram(
-                normalized,
-                x="Valor",
-                color="Indicador",
-                nbins=10,
-                title=f"Distribución de indicadores - {name}",
+            groups = normalized.groupby("Indicador", sort=False)["Valor"]
+            edges = _histogram_edges(normalized["Valor"])
+            hist = go.Figure(
+                [_histogram_trace(values, edges, name=indicator) for indicator, values in groups],
+                layout={
+                    "title": {"text": f"Distribución de indicadores - {name}"},
+                    "legend": {"title": {"text": "Indicador"}},
+                    "barmode": "relative",
+                },
             )
-            hist.update_traces(opacity=0.75)
             hist.update_layout(xaxis_title="Cantidad", yaxis_title="Frecuencia")
-            hist_hover = "Indicador: %{fullData.name}<br>Cantidad: %{x}<br>Frecuencia: %{y}<extra></extra>"
-            for trace in hist.data:
-                trace.update(hovertemplate=hist_hover)
-
-            box = px.box(
-                normalized,
-                x="Indicador",
-                y="Valor",
-                title=f"Boxplot por indicador - {name}",
-                color="Indicador",
+            hist_hover = f"Indicador: %{{fullData.name}}<br>Cantidad: {BIN_RANGE_HOVER}<br>Frecuencia: %{{y}}<extra></extra>"
+            hist.update_traces(opacity=0.75, hovertemplate=hist_hover)
+
+            box = go.Figure(
+                [
+                    _box_trace(values, x=[indicator], name=indicator)
+                    for indicator, values in groups
+                ],
+                layout={
+                    "title": {"text": f"Boxplot por indicador - {name}"},
+                    "legend": {"title": {"text": "Indicador"}},
+                    "boxmode": "overlay",
+                },
             )
             box.update_layout(xaxis_title="Indicador", yaxis_title="Cantidad")
-            for trace in box.data:
-                trace.update(hovertemplate="Indicador: %{x}<br>Valor: %{y}<extra></extra>")
+            box.update_traces(hovertemplate="Indicador: %{x}<br>Valor: %{y}<extra></extra>")
 
         else:  # Tamaño de empresa
-            normalized = frame.copy()
-            normalized = normalized.rename(
+            normalized = frame.rename(
                 columns={
                     "company_size": "Tamaño de empresa",
                     "companies": "Empresas",
                     "installations": "Instalaciones",
                 }
             )
-            hist = px.histogram(
-                normalized,
-                x="Empresas",
-                color_discrete_sequence=["#1f77b4"],
-                nbins=10,
-                title="Distribución de empresas por tamaño",
+            companies = normalized["Empresas"]
+            edges = _histogram_edges(companies)
+            hist = go.Figure(
+                _histogram_trace(companies, edges, marker_color="#1f77b4"),
+                layout={"title": {"text": "Distribución de empresas por tamaño"}},
             )
             hist.update_layout(xaxis_title="Empresas", yaxis_title="Frecuencia")
-            for trace in hist.data:
-                trace.update(hovertemplate="Empresas: %{x}<br>Frecuencia: %{y}<extra></extra>")
+            hist.update_traces(hovertemplate=f"Empresas: {BIN_RANGE_HOVER}<br>Frecuencia: %{{y}}<extra></extra>")
 
-            box = px.box(
-                normalized,
-                y="Instalaciones",
-                title="Boxplot de instalaciones por tamaño",
+            box = go.Figure(
+                _box_trace(normalized["Instalaciones"], x0=" "),
+                layout={"title": {"text": "Boxplot de instalaciones por tamaño"}},
             )
             box.update_layout(yaxis_title="Instalaciones")
-            for trace in box.data:
-                trace.update(hovertemplate="Instalaciones: %{y}<extra></extra>")
+            box.update_traces(hovertemplate="Instalaciones: %{y}<extra></extra>")
 
         figures[name] = {
-            "hist": json.loads(hist.to_json()),
-            "box": json.loads(box.to_json()),
+            "hist": hist.to_plotly_json(),
+            "box": box.to_plotly_json(),
         }
 
     return figures
 
 
-def build_distribution_html(figures: dict[str, dict[str, dict[str, object]]]) -> str:
+def write_distribution_html(
+    figures: dict[str, dict[str, dict[str, object]]], path: Path
+) -> None:
     dataset_options = list(figures.keys())
     default_dataset = dataset_options[0]
+    option_markup = "".join(
+        f'<option value="{option}">{option}</option>' for option in dataset_options
+    )
 
-    html = f"""<!DOCTYPE html>
-<html lang=\"es\">
-<head>
-    <meta charset=\"utf-8\" />
-    <title>Explorador de distribuciones APL</title>
-    <script src=\"https://cdn.plot.ly/plotly-2.30.0.min.js\"></script>
-    <style>
-        body {{ font-family: "Segoe UI", Tahoma, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 24px; border-radius: 16px; box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1); }}
-        h1 {{ text-align: center; margin-bottom: 16px; }}
-        .controls {{ display: flex; flex-wrap: wrap; gap: 12px; justify-content: center; margin-bottom: 18px; }}
-        label {{ font-weight: 600; margin-right: 8px; }}
-        select {{ padding: 6px 10px; border-radius: 6px; border: 1px solid #cbd5e0; }}
-        #chart {{ width: 100%; height: 640px; }}
-    </style>
-</head>
-<body>
-    <div class=\"container\">
-        <h1>Explorador de distribuciones APL</h1>
-        <div class=\"controls\">
-            <div>
-                <label for=\"dataset-select\">Conjunto:</label>
-                <select id=\"dataset-select\">
-                    {''.join(f'<option value=\"{option}\">{option}</option>' for option in dataset_options)}
+    _write_page(
+        path,
+        title="Explorador de distribuciones APL",
+        heading="Explorador de distribuciones APL",
+        styles="""        .controls { display: flex; flex-wrap: wrap; gap: 12px; justify-content: center; margin-bottom: 18px; }
+        label { font-weight: 600; margin-right: 8px; }
+        select { padding: 6px 10px; border-radius: 6px; border: 1px solid #cbd5e0; }
+        #chart { width: 100%; height: 640px; }
+""",
+        controls=f"""            <div>
+                <label for="dataset-select">Conjunto:</label>
+                <select id="dataset-select">
+                    {option_markup}
                 </select>
             </div>
             <div>
-                <label for=\"chart-select\">Visualización:</label>
-                <select id=\"chart-select\">
-                    <option value=\"hist\">Histograma</option>
-                    <option value=\"box\">Boxplot</option>
+                <label for="chart-select">Visualización:</label>
+                <select id="chart-select">
+                    <option value="hist">Histograma</option>
+                    <option value="box">Boxplot</option>
                 </select>
-            </div>
-        </div>
-        <div id=\"chart\"></div>
-    </div>
-    <script>
-        const figures = {json.dumps(figures)};
-        let currentDataset = {json.dumps(default_dataset)};
+            </div>""",
+        chart_id="chart",
+        constants={"figures": figures, "defaultDataset": default_dataset},
+        script="""        let currentDataset = defaultDataset;
         let currentChart = 'hist';
 
         const datasetSelect = document.getElementById('dataset-select');
@@ -176,47 +382,47 @@ def build_distribution_html(figures: dict[str, dict[str, dict[str, object]]]) ->
 
         datasetSelect.value = currentDataset;
 
-        function render() {{
+        function render() {
             const figure = figures[currentDataset][currentChart];
-            Plotly.react('chart', figure.data, figure.layout, {{responsive: true}});
-        }}
+            Plotly.react('chart', figure.data, figure.layout, {responsive: true});
+        }
 
-        datasetSelect.addEventListener('change', (event) => {{
+        datasetSelect.addEventListener('change', (event) => {
             currentDataset = event.target.value;
             render();
-        }});
+        });
 
-        chartSelect.addEventListener('change', (event) => {{
+        chartSelect.addEventListener('change', (event) => {
             currentChart = event.target.value;
             render();
-        }});
+        });
 
         render();
-    </script>
-</body>
-</html>
-"""
-    return html
+""",
+    )
 
 
-def load_time_series_records() -> list[dict[str, int]]:
-    frame = pd.read_csv(DATA_DIR / "yearly_summary.csv")
-    normalized = frame.copy()
-    for column in ["year", "companies_adhesion", "companies_certification"]:
-        normalized[column] = (
-            pd.to_numeric(normalized[column], errors="coerce").fillna(0).astype(int)
-        )
+def load_time_series_records() -> dict[str, dict[str, list[int]]]:
+    normalized = (
+        _read_typed_csv(DATA_DIR / "yearly_summary.csv", TIME_SERIES_DTYPES)
+        .fillna(0)
+        .sort_values("year")
+    )
 
-    records: list[dict[str, int]] = []
-    for row in normalized.itertuples(index=False):
-        year = int(row.year)
-        records.append({"year": year, "scope": "Adhesión", "value": int(row.companies_adhesion)})
-        records.append({"year": year, "scope": "Certificación", "value": int(row.companies_certification)})
-    return records
+    years = normalized["year"].tolist()
+    return {
+        "Adhesión": {"years": years, "values": normalized["companies_adhesion"].tolist()},
+        "Certificación": {
+            "years": years,
+            "values": normalized["companies_certification"].tolist(),
+        },
+    }
 
 
-def build_time_series_html(records: list[dict[str, int]]) -> str:
-    years = sorted({item["year"] for item in records})
+def write_time_series_html(
+    records: dict[str, dict[str, list[int]]], path: Path
+) -> None:
+    years = sorted({year for series in records.values() for year in series["years"]})
     if not years:
         raise ValueError("No se encontraron datos para construir la vista de series de tiempo.")
 
@@ -229,262 +435,238 @@ def build_time_series_html(records: list[dict[str, int]]) -> str:
         for index, year in enumerate(years)
     )
 
-    html = f"""<!DOCTYPE html>
-<html lang=\"es\">
-<head>
-    <meta charset=\"utf-8\" />
-    <title>Tendencia de empresas APL</title>
-    <script src=\"https://cdn.plot.ly/plotly-2.30.0.min.js\"></script>
-    <style>
-        body {{ font-family: \"Segoe UI\", Tahoma, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 24px; border-radius: 16px; box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1); }}
-        h1 {{ text-align: center; margin-bottom: 16px; }}
-        .controls {{ display: flex; flex-wrap: wrap; gap: 12px; justify-content: center; margin-bottom: 18px; }}
-        .controls-group {{ display: flex; align-items: center; gap: 8px; }}
-        label {{ font-weight: 600; }}
-        select {{ padding: 6px 10px; border-radius: 6px; border: 1px solid #cbd5e0; }}
-        .checkboxes {{ display: flex; align-items: center; gap: 16px; }}
-        #time-series-chart {{ width: 100%; height: 640px; }}
-    </style>
-</head>
-<body>
-    <div class=\"container\">
-        <h1>Empresas por año</h1>
-        <div class=\"controls\">
-            <div class=\"controls-group\">
-                <label for=\"start-year\">Año inicial:</label>
-                <select id=\"start-year\">{start_options}</select>
+    _write_page(
+        path,
+        title="Tendencia de empresas APL",
+        heading="Empresas por año",
+        styles="""        .controls { display: flex; flex-wrap: wrap; gap: 12px; justify-content: center; margin-bottom: 18px; }
+        .controls-group { display: flex; align-items: center; gap: 8px; }
+        label { font-weight: 600; }
+        select { padding: 6px 10px; border-radius: 6px; border: 1px solid #cbd5e0; }
+        .checkboxes { display: flex; align-items: center; gap: 16px; }
+        #time-series-chart { width: 100%; height: 640px; }
+""",
+        controls=f"""            <div class="controls-group">
+                <label for="start-year">Año inicial:</label>
+                <select id="start-year">{start_options}</select>
             </div>
-            <div class=\"controls-group\">
-                <label for=\"end-year\">Año final:</label>
-                <select id=\"end-year\">{end_options}</select>
+            <div class="controls-group">
+                <label for="end-year">Año final:</label>
+                <select id="end-year">{end_options}</select>
             </div>
-            <div class=\"checkboxes\">
-                <label><input type=\"checkbox\" class=\"scope-checkbox\" value=\"Adhesión\" checked /> Adhesión</label>
-                <label><input type=\"checkbox\" class=\"scope-checkbox\" value=\"Certificación\" checked /> Certificación</label>
-            </div>
-        </div>
-        <div id=\"time-series-chart\"></div>
-    </div>
-    <script>
-        const records = {json.dumps(records)};
-        const startSelect = document.getElementById('start-year');
+            <div class="checkboxes">
+                <label><input type="checkbox" class="scope-checkbox" value="Adhesión" checked /> Adhesión</label>
+                <label><input type="checkbox" class="scope-checkbox" value="Certificación" checked /> Certificación</label>
+            </div>""",
+        chart_id="time-series-chart",
+        constants={"records": records},
+        script="""        const startSelect = document.getElementById('start-year');
         const endSelect = document.getElementById('end-year');
         const scopeCheckboxes = Array.from(document.querySelectorAll('.scope-checkbox'));
 
-        function handleYearChange(event) {{
+        function handleYearChange(event) {
             const startValue = parseInt(startSelect.value, 10);
             const endValue = parseInt(endSelect.value, 10);
-            if (startValue > endValue) {{
-                if (event.target === startSelect) {{
+            if (startValue > endValue) {
+                if (event.target === startSelect) {
                     endSelect.value = startSelect.value;
-                }} else {{
+                } else {
                     startSelect.value = endSelect.value;
-                }}
-            }}
+                }
+            }
             render();
-        }}
+        }
+
+        function lowerBound(values, target) {
+            let low = 0;
+            let high = values.length;
+            while (low < high) {
+                const middle = (low + high) >> 1;
+                if (values[middle] < target) {
+                    low = middle + 1;
+                } else {
+                    high = middle;
+                }
+            }
+            return low;
+        }
 
-        function render() {{
+        function render() {
             const startYear = parseInt(startSelect.value, 10);
             const endYear = parseInt(endSelect.value, 10);
             const activeScopes = scopeCheckboxes
                 .filter((checkbox) => checkbox.checked)
                 .map((checkbox) => checkbox.value);
 
-            if (activeScopes.length === 0) {{
-                const emptyLayout = {{
+            if (activeScopes.length === 0) {
+                const emptyLayout = {
                     title: 'Empresas por año',
-                    xaxis: {{ title: 'Año' }},
-                    yaxis: {{ title: 'Empresas' }},
-                    annotations: [{{
+                    xaxis: { title: 'Año' },
+                    yaxis: { title: 'Empresas' },
+                    annotations: [{
                         text: 'Selecciona al menos un ámbito para visualizar la serie.',
                         showarrow: false,
                         x: 0.5,
                         y: 0.5,
                         xref: 'paper',
                         yref: 'paper',
-                        font: {{ size: 16 }},
-                    }}],
-                }};
-                Plotly.react('time-series-chart', [], emptyLayout, {{responsive: true}});
+                        font: { size: 16 },
+                    }],
+                };
+                Plotly.react('time-series-chart', [], emptyLayout, {responsive: true});
                 return;
-            }}
-
-            const filtered = records.filter((item) =>
-                item.year >= startYear && item.year <= endYear && activeScopes.includes(item.scope)
-            );
-
-            const tracesMap = new Map();
-            filtered.forEach((item) => {{
-                if (!tracesMap.has(item.scope)) {{
-                    tracesMap.set(item.scope, {{ x: [], y: [], mode: 'lines+markers', name: item.scope }});
-                }}
-                const trace = tracesMap.get(item.scope);
-                trace.x.push(item.year);
-                trace.y.push(item.value);
-            }});
-
-            const traces = Array.from(tracesMap.values());
-            const layout = {{
+            }
+
+            const traces = activeScopes.map((scope) => {
+                const series = records[scope];
+                const start = lowerBound(series.years, startYear);
+                const end = lowerBound(series.years, endYear + 1);
+                return {
+                    x: series.years.slice(start, end),
+                    y: series.values.slice(start, end),
+                    mode: 'lines+markers',
+                    name: scope,
+                };
+            });
+
+            const layout = {
                 title: 'Empresas por año',
-                xaxis: {{ title: 'Año', dtick: 1 }},
-                yaxis: {{ title: 'Empresas' }},
-                legend: {{ title: {{ text: 'Ámbito' }} }},
-            }};
+                xaxis: { title: 'Año', dtick: 1 },
+                yaxis: { title: 'Empresas' },
+                legend: { title: { text: 'Ámbito' } },
+            };
 
-            traces.forEach((trace) => {{
-                trace.hovertemplate = 'Año: %{{x}}<br>Empresas: %{{y}}<br>Ámbito: ' + trace.name + '<extra></extra>';
-            }});
+            traces.forEach((trace) => {
+                trace.hovertemplate = 'Año: %{x}<br>Empresas: %{y}<br>Ámbito: ' + trace.name + '<extra></extra>';
+            });
 
-            Plotly.react('time-series-chart', traces, layout, {{responsive: true}});
-        }}
+            Plotly.react('time-series-chart', traces, layout, {responsive: true});
+        }
 
         startSelect.addEventListener('change', handleYearChange);
         endSelect.addEventListener('change', handleYearChange);
         scopeCheckboxes.forEach((checkbox) => checkbox.addEventListener('change', render));
 
         render();
-    </script>
-</body>
-</html>
-"""
-    return html
+""",
+    )
 
 
-def build_comparison_html(
-    time_records: list[dict[str, int]], size_frame: pd.DataFrame
-) -> str:
-    normalized = size_frame.copy()
-    normalized["company_size"] = normalized["company_size"].astype(str)
-    normalized["companies"] = (
-        pd.to_numeric(normalized["companies"], errors="coerce").fillna(0).astype(int)
-    )
+def write_comparison_html(
+    time_records: dict[str, dict[str, list[int]]],
+    size_frame: pd.DataFrame,
+    size_order: list[str],
+    path: Path,
+) -> None:
+    normalized = _normalize_size_frame(size_frame)
 
-    size_records = [
-        {"company_size": row.company_size, "companies": int(row.companies)}
-        for row in normalized.itertuples(index=False)
-    ]
+    size_records = normalized[["company_size", "companies"]].to_dict(orient="records")
 
-    years = sorted({record["year"] for record in time_records})
+    years = sorted(
+        {year for series in time_records.values() for year in series["years"]}
+    )
     if not years:
         raise ValueError(
             "No se encontraron datos de series de tiempo para el panel comparativo."
         )
 
-    html = f"""<!DOCTYPE html>
-<html lang=\"es\">
-<head>
-    <meta charset=\"utf-8\" />
-    <title>Panel comparativo de empresas APL</title>
-    <script src=\"https://cdn.plot.ly/plotly-2.30.0.min.js\"></script>
-    <style>
-        body {{ font-family: \"Segoe UI\", Tahoma, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 24px; border-radius: 16px; box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1); }}
-        h1 {{ text-align: center; margin-bottom: 16px; }}
-        .controls {{ display: flex; justify-content: center; margin-bottom: 18px; gap: 12px; }}
-        label {{ font-weight: 600; }}
-        select {{ padding: 6px 10px; border-radius: 6px; border: 1px solid #cbd5e0; }}
-        #comparison-chart {{ width: 100%; height: 640px; }}
-    </style>
-</head>
-<body>
-    <div class=\"container\">
-        <h1>Panel comparativo de empresas</h1>
-        <div class=\"controls\">
-            <label for=\"view-select\">Vista:</label>
-            <select id=\"view-select\">
-                <option value=\"time\" selected>Serie temporal</option>
-                <option value=\"size\">Tamaño de empresa</option>
-            </select>
-        </div>
-        <div id=\"comparison-chart\"></div>
-    </div>
-    <script>
-        const timeRecords = {json.dumps(time_records)};
-        const sizeRecords = {json.dumps(size_records)};
-        const viewSelect = document.getElementById('view-select');
-
-        function buildTimeTraces() {{
-            const tracesMap = new Map();
-            timeRecords.forEach((item) => {{
-                if (!tracesMap.has(item.scope)) {{
-                    tracesMap.set(item.scope, {{ x: [], y: [], mode: 'lines+markers', name: item.scope }});
-                }}
-                const trace = tracesMap.get(item.scope);
-                trace.x.push(item.year);
-                trace.y.push(item.value);
-            }});
-
-            const traces = Array.from(tracesMap.values());
-            traces.forEach((trace) => {{
-                trace.hovertemplate = 'Año: %{{x}}<br>Empresas: %{{y}}<br>Ámbito: ' + trace.name + '<extra></extra>';
-            }});
+    _write_page(
+        path,
+        title="Panel comparativo de empresas APL",
+        heading="Panel comparativo de empresas",
+        styles="""        .controls { display: flex; justify-content: center; margin-bottom: 18px; gap: 12px; }
+        label { font-weight: 600; }
+        select { padding: 6px 10px; border-radius: 6px; border: 1px solid #cbd5e0; }
+        #comparison-chart { width: 100%; height: 640px; }
+""",
+        controls="""            <label for="view-select">Vista:</label>
+            <select id="view-select">
+                <option value="time" selected>Serie temporal</option>
+                <option value="size">Tamaño de empresa</option>
+            </select>""",
+        chart_id="comparison-chart",
+        constants={
+            "timeRecords": time_records,
+            "sizeOrder": size_order,
+            "sizeRecords": size_records,
+        },
+        script="""        const viewSelect = document.getElementById('view-select');
+
+        function buildTimeTraces() {
+            const traces = Object.entries(timeRecords).map(([scope, series]) => (
+                { x: series.years, y: series.values, mode: 'lines+markers', name: scope }
+            ));
+            traces.forEach((trace) => {
+                trace.hovertemplate = 'Año: %{x}<br>Empresas: %{y}<br>Ámbito: ' + trace.name + '<extra></extra>';
+            });
             return traces;
-        }}
+        }
 
-        function buildTimeLayout() {{
-            return {{
+        function buildTimeLayout() {
+            return {
                 title: 'Empresas por año',
-                xaxis: {{ title: 'Año', dtick: 1 }},
-                yaxis: {{ title: 'Empresas' }},
-                legend: {{ title: {{ text: 'Ámbito' }} }},
-            }};
-        }}
-
-        function buildSizeTrace() {{
-            const trace = {{
+                xaxis: { title: 'Año', dtick: 1 },
+                yaxis: { title: 'Empresas' },
+                legend: { title: { text: 'Ámbito' } },
+            };
+        }
+
+        function buildSizeTrace() {
+            const trace = {
                 type: 'bar',
                 x: sizeRecords.map((item) => item.company_size),
                 y: sizeRecords.map((item) => item.companies),
                 text: sizeRecords.map((item) => item.companies),
                 textposition: 'outside',
-                marker: {{ color: '#1f77b4' }},
-                hovertemplate: 'Tamaño de empresa: %{{x}}<br>Empresas: %{{y}}<extra></extra>',
+                marker: { color: '#1f77b4' },
+                hovertemplate: 'Tamaño de empresa: %{x}<br>Empresas: %{y}<extra></extra>',
                 name: 'Empresas',
-            }};
+            };
             return [trace];
-        }}
+        }
 
-        function buildSizeLayout() {{
-            return {{
+        function buildSizeLayout() {
+            return {
                 title: 'Empresas por tamaño de empresa (Adhesión)',
-                xaxis: {{ title: 'Tamaño de empresa' }},
-                yaxis: {{ title: 'Empresas' }},
+                xaxis: { title: 'Tamaño de empresa', categoryorder: 'array', categoryarray: sizeOrder },
+                yaxis: { title: 'Empresas' },
                 showlegend: false,
-            }};
-        }}
+            };
+        }
 
-        function render() {{
-            if (viewSelect.value === 'size') {{
-                Plotly.react('comparison-chart', buildSizeTrace(), buildSizeLayout(), {{responsive: true}});
+        function render() {
+            if (viewSelect.value === 'size') {
+                Plotly.react('comparison-chart', buildSizeTrace(), buildSizeLayout(), {responsive: true});
                 return;
-            }}
+            }
 
-            Plotly.react('comparison-chart', buildTimeTraces(), buildTimeLayout(), {{responsive: true}});
-        }}
+            Plotly.react('comparison-chart', buildTimeTraces(), buildTimeLayout(), {responsive: true});
+        }
 
         viewSelect.addEventListener('change', render);
 
         render();
-    </script>
-</body>
-</html>
-"""
-    return html
+""",
+    )
 
 
-def build_sector_html(frame: pd.DataFrame) -> str:
-    processed = frame.copy()
+def write_sector_html(frame: pd.DataFrame, path: Path) -> None:
     sector_totals = (
-        processed.groupby("sector")["installations"].sum().sort_values(ascending=False)
+        frame.groupby("sector", observed=True)["installations"].sum().sort_values(ascending=False)
     )
     sector_order = sector_totals.index.tolist()
 
-    dataset_payload: dict[str, list[int]] = {}
-    for dataset, group in processed.groupby("dataset"):
-        data_map = group.set_index("sector")["installations"].to_dict()
-        dataset_payload[dataset] = [int(data_map.get(sector, 0)) for sector in sector_order]
+    pivot = frame.pivot_table(
+        index="sector",
+        columns="dataset",
+        values="installations",
+        aggfunc="sum",
+        fill_value=0,
+        observed=True,
+    ).reindex(sector_order, fill_value=0)
+    dataset_payload: dict[str, list[int]] = {
+        dataset: pivot[dataset].astype(int).tolist() for dataset in pivot.columns
+    }
 
     preferred_order = ["Adhesión", "Certificación"]
     dataset_labels = [label for label in preferred_order if label in dataset_payload]
@@ -497,61 +679,46 @@ def build_sector_html(frame: pd.DataFrame) -> str:
         for dataset in dataset_labels
     )
 
-    html = f"""<!DOCTYPE html>
-<html lang=\"es\">
-<head>
-    <meta charset=\"utf-8\" />
-    <title>Instalaciones por sector económico</title>
-    <script src=\"https://cdn.plot.ly/plotly-2.30.0.min.js\"></script>
-    <style>
-        body {{ font-family: \"Segoe UI\", Tahoma, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 24px; border-radius: 16px; box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1); }}
-        h1 {{ text-align: center; margin-bottom: 16px; }}
-        .controls {{ display: flex; flex-wrap: wrap; gap: 16px; justify-content: center; margin-bottom: 18px; }}
-        .controls label {{ font-weight: 600; display: flex; align-items: center; gap: 6px; }}
-        #sector-chart {{ width: 100%; height: 720px; }}
-    </style>
-</head>
-<body>
-    <div class=\"container\">
-        <h1>Instalaciones por sector económico</h1>
-        <div class=\"controls\">
-            {checkbox_markup}
-        </div>
-        <div id=\"sector-chart\"></div>
-    </div>
-    <script>
-        const sectorOrder = {json.dumps(sector_order)};
-        const datasetPayload = {json.dumps(dataset_payload)};
-        const datasetCheckboxes = Array.from(document.querySelectorAll('.dataset-checkbox'));
-
-        function render() {{
+    _write_page(
+        path,
+        title="Instalaciones por sector económico",
+        heading="Instalaciones por sector económico",
+        styles="""        .controls { display: flex; flex-wrap: wrap; gap: 16px; justify-content: center; margin-bottom: 18px; }
+        .controls label { font-weight: 600; display: flex; align-items: center; gap: 6px; }
+        #sector-chart { width: 100%; height: 720px; }
+""",
+        controls=f"""            {checkbox_markup}""",
+        chart_id="sector-chart",
+        constants={"sectorOrder": sector_order, "datasetPayload": dataset_payload},
+        script="""        const datasetCheckboxes = Array.from(document.querySelectorAll('.dataset-checkbox'));
+
+        function render() {
             const activeDatasets = datasetCheckboxes
                 .filter((checkbox) => checkbox.checked)
                 .map((checkbox) => checkbox.value);
 
-            if (activeDatasets.length === 0) {{
-                const emptyLayout = {{
+            if (activeDatasets.length === 0) {
+                const emptyLayout = {
                     title: 'Instalaciones por sector económico',
-                    xaxis: {{ title: 'Instalaciones' }},
-                    yaxis: {{ title: 'Sector', categoryorder: 'array', categoryarray: sectorOrder }},
-                    annotations: [{{
+                    xaxis: { title: 'Instalaciones' },
+                    yaxis: { title: 'Sector', categoryorder: 'array', categoryarray: sectorOrder },
+                    annotations: [{
                         text: 'Selecciona al menos un tipo para visualizar las instalaciones.',
                         showarrow: false,
                         x: 0.5,
                         y: 0.5,
                         xref: 'paper',
                         yref: 'paper',
-                        font: {{ size: 16 }},
-                    }}],
-                }};
-                Plotly.react('sector-chart', [], emptyLayout, {{responsive: true}});
+                        font: { size: 16 },
+                    }],
+                };
+                Plotly.react('sector-chart', [], emptyLayout, {responsive: true});
                 return;
-            }}
+            }
 
-            const traces = activeDatasets.map((dataset) => {{
+            const traces = activeDatasets.map((dataset) => {
                 const values = datasetPayload[dataset] || [];
-                return {{
+                return {
                     type: 'bar',
                     orientation: 'h',
                     x: values,
@@ -559,48 +726,34 @@ def build_sector_html(frame: pd.DataFrame) -> str:
                     name: dataset,
                     text: values,
                     textposition: 'outside',
-                    hovertemplate: 'Sector: %{{y}}<br>Instalaciones: %{{x}}<br>Tipo: ' + dataset + '<extra></extra>',
-                }};
-            }});
+                    hovertemplate: 'Sector: %{y}<br>Instalaciones: %{x}<br>Tipo: ' + dataset + '<extra></extra>',
+                };
+            });
 
-            const layout = {{
+            const layout = {
                 title: 'Instalaciones por sector económico',
-                xaxis: {{ title: 'Instalaciones' }},
-                yaxis: {{
+                xaxis: { title: 'Instalaciones' },
+                yaxis: {
                     title: 'Sector',
                     categoryorder: 'array',
                     categoryarray: sectorOrder,
-                }},
+                },
                 barmode: 'group',
-                legend: {{ title: {{ text: 'Tipo' }} }},
-            }};
+                legend: { title: { text: 'Tipo' } },
+            };
 
-            Plotly.react('sector-chart', traces, layout, {{responsive: true}});
-        }}
+            Plotly.react('sector-chart', traces, layout, {responsive: true});
+        }
 
         datasetCheckboxes.forEach((checkbox) => checkbox.addEventListener('change', render));
 
         render();
-    </script>
-</body>
-</html>
-"""
-    return html
-
-
-def build_size_html(frame: pd.DataFrame) -> str:
-    normalized = frame.copy()
-    normalized["company_size"] = normalized["company_size"].astype(str)
-    normalized["companies"] = (
-        pd.to_numeric(normalized["companies"], errors="coerce").fillna(0).astype(int)
-    )
-    normalized["installations"] = (
-        pd.to_numeric(normalized["installations"], errors="coerce").fillna(0).astype(int)
+""",
     )
 
-    size_order = (
-        normalized.sort_values("companies", ascending=False)["company_size"].tolist()
-    )
+
+def write_size_html(frame: pd.DataFrame, size_order: list[str], path: Path) -> None:
+    normalized = _normalize_size_frame(frame)
 
     metric_payload = {
         "Empresas": normalized.set_index("company_size")["companies"].reindex(size_order).astype(int).tolist(),
@@ -612,125 +765,116 @@ def build_size_html(frame: pd.DataFrame) -> str:
         for metric in metric_payload
     )
 
-    html = f"""<!DOCTYPE html>
-<html lang=\"es\">
-<head>
-    <meta charset=\"utf-8\" />
-    <title>Empresas e instalaciones por tamaño de empresa</title>
-    <script src=\"https://cdn.plot.ly/plotly-2.30.0.min.js\"></script>
-    <style>
-        body {{ font-family: \"Segoe UI\", Tahoma, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 24px; border-radius: 16px; box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1); }}
-        h1 {{ text-align: center; margin-bottom: 16px; }}
-        .controls {{ display: flex; flex-wrap: wrap; gap: 16px; justify-content: center; margin-bottom: 18px; }}
-        .controls label {{ font-weight: 600; display: flex; align-items: center; gap: 6px; }}
-        #size-chart {{ width: 100%; height: 640px; }}
-    </style>
-</head>
-<body>
-    <div class=\"container\">
-        <h1>Empresas e instalaciones por tamaño de empresa</h1>
-        <div class=\"controls\">
-            {checkbox_markup}
-        </div>
-        <div id=\"size-chart\"></div>
-    </div>
-    <script>
-        const sizeOrder = {json.dumps(size_order)};
-        const metricPayload = {json.dumps(metric_payload)};
-        const metricCheckboxes = Array.from(document.querySelectorAll('.metric-checkbox'));
-
-        function render() {{
+    _write_page(
+        path,
+        title="Empresas e instalaciones por tamaño de empresa",
+        heading="Empresas e instalaciones por tamaño de empresa",
+        styles="""        .controls { display: flex; flex-wrap: wrap; gap: 16px; justify-content: center; margin-bottom: 18px; }
+        .controls label { font-weight: 600; display: flex; align-items: center; gap: 6px; }
+        #size-chart { width: 100%; height: 640px; }
+""",
+        controls=f"""            {checkbox_markup}""",
+        chart_id="size-chart",
+        constants={"sizeOrder": size_order, "metricPayload": metric_payload},
+        script="""        const metricCheckboxes = Array.from(document.querySelectorAll('.metric-checkbox'));
+
+        function render() {
             const activeMetrics = metricCheckboxes
                 .filter((checkbox) => checkbox.checked)
                 .map((checkbox) => checkbox.value);
 
-            if (activeMetrics.length === 0) {{
-                const emptyLayout = {{
+            if (activeMetrics.length === 0) {
+                const emptyLayout = {
                     title: 'Empresas e instalaciones por tamaño de empresa',
-                    xaxis: {{ title: 'Tamaño de empresa', categoryorder: 'array', categoryarray: sizeOrder }},
-                    yaxis: {{ title: 'Cantidad' }},
-                    annotations: [{{
+                    xaxis: { title: 'Tamaño de empresa', categoryorder: 'array', categoryarray: sizeOrder },
+                    yaxis: { title: 'Cantidad' },
+                    annotations: [{
                         text: 'Selecciona al menos un indicador para visualizar la comparación.',
                         showarrow: false,
                         x: 0.5,
                         y: 0.5,
                         xref: 'paper',
                         yref: 'paper',
-                        font: {{ size: 16 }},
-                    }}],
-                }};
-                Plotly.react('size-chart', [], emptyLayout, {{responsive: true}});
+                        font: { size: 16 },
+                    }],
+                };
+                Plotly.react('size-chart', [], emptyLayout, {responsive: true});
                 return;
-            }}
+            }
 
-            const traces = activeMetrics.map((metric) => {{
+            const traces = activeMetrics.map((metric) => {
                 const values = metricPayload[metric] || [];
-                return {{
+                return {
                     type: 'bar',
                     x: sizeOrder,
                     y: values,
                     name: metric,
                     text: values,
                     textposition: 'outside',
-                    hovertemplate: 'Tamaño de empresa: %{{x}}<br>' + metric + ': %{{y}}<extra></extra>',
-                }};
-            }});
+                    hovertemplate: 'Tamaño de empresa: %{x}<br>' + metric + ': %{y}<extra></extra>',
+                };
+            });
 
-            const layout = {{
+            const layout = {
                 title: 'Empresas e instalaciones por tamaño de empresa',
-                xaxis: {{ title: 'Tamaño de empresa', categoryorder: 'array', categoryarray: sizeOrder }},
-                yaxis: {{ title: 'Cantidad' }},
+                xaxis: { title: 'Tamaño de empresa', categoryorder: 'array', categoryarray: sizeOrder },
+                yaxis: { title: 'Cantidad' },
                 barmode: 'group',
-                legend: {{ title: {{ text: 'Tipo' }} }},
-            }};
+                legend: { title: { text: 'Tipo' } },
+            };
 
-            Plotly.react('size-chart', traces, layout, {{responsive: true}});
-        }}
+            Plotly.react('size-chart', traces, layout, {responsive: true});
+        }
 
         metricCheckboxes.forEach((checkbox) => checkbox.addEventListener('change', render));
 
         render();
-    </script>
-</body>
-</html>
-"""
-    return html
+""",
+    )
 
 
 def main() -> None:
     docs_dir = DISTRIBUTION_OUTPUT_PATH.parent
     docs_dir.mkdir(parents=True, exist_ok=True)
 
-    distribution_sources = load_distribution_sources()
-    figures = build_figures(distribution_sources)
-    DISTRIBUTION_OUTPUT_PATH.write_text(
-        build_distribution_html(figures), encoding="utf-8"
-    )
+    stale: dict[Path, str] = {}
+    for output, inputs in ARTIFACT_INPUTS.items():
+        fingerprint = _fingerprint([*inputs, SCRIPT_PATH])
+        if _is_up_to_date(output, fingerprint):
+            print(f"Archivo HTML sin cambios: {output}")
+        else:
+            stale[output] = fingerprint
+    if not stale:
+        return
 
+    distribution_sources = load_distribution_sources()
     time_series_records = load_time_series_records()
-    TIME_SERIES_OUTPUT_PATH.write_text(
-        build_time_series_html(time_series_records), encoding="utf-8"
-    )
-
-    size_frame = distribution_sources["Tamaño de empresa"].copy()
-    COMPARISON_OUTPUT_PATH.write_text(
-        build_comparison_html(time_series_records, size_frame.copy()), encoding="utf-8"
-    )
-    SIZE_OUTPUT_PATH.write_text(
-        build_size_html(size_frame), encoding="utf-8"
-    )
-
+    size_frame = _normalize_size_frame(distribution_sources["Tamaño de empresa"])
+    size_order = size_frame["company_size"].cat.categories.tolist()
     sector_frame = load_sector_summary()
-    SECTOR_OUTPUT_PATH.write_text(
-        build_sector_html(sector_frame), encoding="utf-8"
-    )
 
-    print(f"Archivo HTML generado en: {DISTRIBUTION_OUTPUT_PATH}")
-    print(f"Archivo HTML generado en: {TIME_SERIES_OUTPUT_PATH}")
-    print(f"Archivo HTML generado en: {COMPARISON_OUTPUT_PATH}")
-    print(f"Archivo HTML generado en: {SECTOR_OUTPUT_PATH}")
-    print(f"Archivo HTML generado en: {SIZE_OUTPUT_PATH}")
+    writers: dict[Path, Callable[[Path], None]] = {
+        TIME_SERIES_OUTPUT_PATH: partial(write_time_series_html, time_series_records),
+        COMPARISON_OUTPUT_PATH: partial(
+            write_comparison_html, time_series_records, size_frame, size_order
+        ),
+        SECTOR_OUTPUT_PATH: partial(write_sector_html, sector_frame),
+        SIZE_OUTPUT_PATH: partial(write_size_html, size_frame, size_order),
+    }
+    if DISTRIBUTION_OUTPUT_PATH in stale:
+        figures = build_figures(distribution_sources)
+        writers[DISTRIBUTION_OUTPUT_PATH] = partial(write_distribution_html, figures)
+
+    with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+        futures = [
+            executor.submit(_write_artifact, writers[output], output, fingerprint)
+            for output, fingerprint in stale.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+    for output in stale:
+        print(f"Archivo HTML generado en: {output}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, List
 
@@ -30,7 +31,10 @@ class ETLConfig:
     dataset_configs: Dict[str, DatasetConfig]
 
     @classmethod
-    def build_default(cls, project_root: Path) -> "ETLConfig":
+    @lru_cache(maxsize=4)
+    def build_default(cls, project_root: Path, output_format: str = "csv") -> "ETLConfig":
+        """Builds the default configuration; repeated calls share one cached instance."""
+
         data_dir = project_root
         output_dir = project_root / "data" / "processed"
 
@@ -39,7 +43,7 @@ class ETLConfig:
         dataset_configs["adhesion_by_year"] = DatasetConfig(
             name="adhesion_by_year",
             source_path=data_dir / "APL - Adhesión x año.csv",
-            output_path=output_dir / "adhesion_by_year.csv",
+            output_path=output_dir / f"adhesion_by_year.{output_format}",
             transformations=[
                 transformers.drop_completely_empty_columns,
                 transformers.drop_completely_empty_rows,
@@ -52,8 +56,7 @@ class ETLConfig:
                     }
                 ),
                 transformers.make_numeric_row_filter(column="year"),
-                transformers.make_integer_column(column="year"),
-                transformers.make_integer_enforcer(["installations", "companies"]),
+                transformers.make_integer_enforcer(["year", "installations", "companies"]),
                 transformers.make_sorter(column="year"),
             ],
         )
@@ -61,7 +64,7 @@ class ETLConfig:
         dataset_configs["adhesion_by_sector"] = DatasetConfig(
             name="adhesion_by_sector",
             source_path=data_dir / "APL - Adhesión x sector.csv",
-            output_path=output_dir / "adhesion_by_sector.csv",
+            output_path=output_dir / f"adhesion_by_sector.{output_format}",
             transformations=[
                 transformers.drop_completely_empty_columns,
                 transformers.drop_completely_empty_rows,
@@ -72,15 +75,16 @@ class ETLConfig:
                         "instalaciones_adheridas_por_sector": "installations",
                     }
                 ),
-                transformers.make_integer_column(column="installations"),
+                transformers.make_integer_enforcer("installations"),
                 transformers.make_sorter(column="installations", ascending=False),
+                transformers.make_categorical("sector"),
             ],
         )
 
         dataset_configs["adhesion_by_size"] = DatasetConfig(
             name="adhesion_by_size",
             source_path=data_dir / "APL - Adhesión x tamaño.csv",
-            output_path=output_dir / "adhesion_by_size.csv",
+            output_path=output_dir / f"adhesion_by_size.{output_format}",
             transformations=[
                 transformers.drop_completely_empty_columns,
                 transformers.drop_completely_empty_rows,
@@ -99,13 +103,14 @@ class ETLConfig:
                 ),
                 transformers.make_integer_enforcer(["companies", "installations"]),
                 transformers.make_sorter(column="companies", ascending=False),
+                transformers.make_categorical("company_size"),
             ],
         )
 
         dataset_configs["certification_by_year"] = DatasetConfig(
             name="certification_by_year",
             source_path=data_dir / "APL - Certificación x año.csv",
-            output_path=output_dir / "certification_by_year.csv",
+            output_path=output_dir / f"certification_by_year.{output_format}",
             transformations=[
                 transformers.drop_completely_empty_columns,
                 transformers.drop_completely_empty_rows,
@@ -118,8 +123,7 @@ class ETLConfig:
                     }
                 ),
                 transformers.make_numeric_row_filter(column="year"),
-                transformers.make_integer_column(column="year"),
-                transformers.make_integer_enforcer(["installations", "companies"]),
+                transformers.make_integer_enforcer(["year", "installations", "companies"]),
                 transformers.make_sorter(column="year"),
             ],
         )
@@ -127,7 +131,7 @@ class ETLConfig:
         dataset_configs["certification_by_sector"] = DatasetConfig(
             name="certification_by_sector",
             source_path=data_dir / "APL - Certificación x sector.csv",
-            output_path=output_dir / "certification_by_sector.csv",
+            output_path=output_dir / f"certification_by_sector.{output_format}",
             transformations=[
                 transformers.drop_completely_empty_columns,
                 transformers.drop_completely_empty_rows,
@@ -138,8 +142,9 @@ class ETLConfig:
                         "instalaciones_certificadas_por_sector": "installations",
                     }
                 ),
-                transformers.make_integer_column(column="installations"),
+                transformers.make_integer_enforcer("installations"),
                 transformers.make_sorter(column="installations", ascending=False),
+                transformers.make_categorical("sector"),
             ],
         )
 
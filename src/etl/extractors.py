@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Protocol
+from typing import Iterable, List, Protocol
 
 import pandas as pd
 
+try:
+    from pyarrow import ArrowInvalid
+    from pyarrow import csv as arrow_csv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    ArrowInvalid = None
+    arrow_csv = None
+
+ARROW_BLOCK_SIZE = 1 << 20
+
 
 class DataValidator(Protocol):
     """Protocol describing dataframe validation behavior."""
@@ -14,6 +24,59 @@ class DataValidator(Protocol):
         ...
 
 
+@lru_cache(maxsize=32)
+def _read_csv_cached(source: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parses a CSV file; the modification time and size only key the cache."""
+
+    return pd.read_csv(source, encoding="utf-8", skip_blank_lines=True)
+
+
+@lru_cache(maxsize=32)
+def _read_arrow_csv_cached(source: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parses a CSV file with pyarrow, deferring to pandas for rows pyarrow rejects.
+
+    The modification time and size only key the cache.
+    """
+
+    try:
+        table = arrow_csv.read_csv(
+            source,
+            read_options=arrow_csv.ReadOptions(
+                use_threads=True, block_size=ARROW_BLOCK_SIZE, encoding="utf-8"
+            ),
+            convert_options=arrow_csv.ConvertOptions(
+                strings_can_be_null=True, quoted_strings_can_be_null=True
+            ),
+        )
+    except ArrowInvalid:
+        return _read_csv_cached(source, mtime_ns, size)
+    dataframe = table.to_pandas(self_destruct=True)
+    dataframe.columns = _pandas_column_names(dataframe.columns)
+    return dataframe
+
+
+def _pandas_column_names(names: Iterable[str]) -> List[str]:
+    """Names blank headers "Unnamed: N" and suffixes duplicates ".1", ".2" like pd.read_csv."""
+
+    columns = list(names)
+    unnamed = {index for index, name in enumerate(columns) if not name}
+    for index in unnamed:
+        columns[index] = f"Unnamed: {index}"
+    loop_order = [index for index in range(len(columns)) if index not in unnamed]
+    loop_order += sorted(unnamed)
+    counts: dict[str, int] = {}
+    for index in loop_order:
+        base = column = columns[index]
+        count = counts.get(column, 0)
+        while count > 0:
+            counts[base] = count + 1
+            column = f"{base}.{count}"
+            count = count + 1 if column in columns else counts.get(column, 0)
+        columns[index] = column
+        counts[column] = count + 1
+    return columns
+
+
 class Extractor(ABC):
     """Defines the interface every extractor must follow."""
 
@@ -25,12 +88,30 @@ class Extractor(ABC):
 class CSVExtractor(Extractor):
     """Loads CSV files located in the local filesystem."""
 
+    _read = staticmethod(_read_csv_cached)
+
     def __init__(self, source: Path, validator: DataValidator | None = None) -> None:
         self._source = source
         self._validator = validator
 
     def extract(self) -> pd.DataFrame:
-        dataframe = pd.read_csv(self._source, encoding="utf-8", skip_blank_lines=True)
+        stat = self._source.stat()
+        cached = self._read(str(self._source), stat.st_mtime_ns, stat.st_size)
+        dataframe = cached.copy()
         if self._validator is not None:
             self._validator.validate(dataframe)
         return dataframe
+
+
+class ArrowCSVExtractor(CSVExtractor):
+    """Loads CSV files with pyarrow's multithreaded parser."""
+
+    _read = staticmethod(_read_arrow_csv_cached)
+
+
+def make_csv_extractor(source: Path, validator: DataValidator | None = None) -> CSVExtractor:
+    """Factory that prefers the pyarrow extractor and falls back to pandas."""
+
+    if arrow_csv is None:
+        return CSVExtractor(source=source, validator=validator)
+    return ArrowCSVExtractor(source=source, validator=validator)
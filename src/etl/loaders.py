@@ -1,22 +1,69 @@
 from __future__ import annotations
 
+import csv
+import os
+from abc import ABC, abstractmethod
 from pathlib import Path
 
 import pandas as pd
 
+CSV_BUFFER_SIZE = 1 << 20
 
-class CSVLoader:
-    """Writes cleaned dataframes into CSV files."""
+
+class Loader(ABC):
+    """Defines the interface every loader must follow."""
 
     def __init__(self, destination: Path) -> None:
         self._destination = destination
 
+    @abstractmethod
     def load(self, dataframe: pd.DataFrame) -> None:
-        self._destination.parent.mkdir(parents=True, exist_ok=True)
-        dataframe.to_csv(self._destination, index=False)
+        """Persist the dataframe at the destination."""
 
     @property
     def destination(self) -> Path:
         """Returns the path where the dataframe will be stored."""
 
         return self._destination
+
+
+class CSVLoader(Loader):
+    """Writes cleaned dataframes into CSV files.
+
+    Integer and text frames are streamed through the csv module; other dtypes fall
+    back to pandas so float and datetime formatting stays unchanged.
+    """
+
+    def load(self, dataframe: pd.DataFrame) -> None:
+        self._destination.parent.mkdir(parents=True, exist_ok=True)
+        if any(dtype.kind not in "biuO" for dtype in dataframe.dtypes):
+            dataframe.to_csv(self._destination, index=False)
+            return
+
+        missing = dataframe.isna()
+        if missing.to_numpy().any():
+            dataframe = dataframe.astype(object).mask(missing, None)
+        with self._destination.open(
+            "w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE
+        ) as handle:
+            writer = csv.writer(handle, lineterminator=os.linesep)
+            writer.writerow(dataframe.columns)
+            writer.writerows(dataframe.itertuples(index=False, name=None))
+
+
+class ParquetLoader(Loader):
+    """Writes cleaned dataframes into Snappy-compressed Parquet files."""
+
+    def load(self, dataframe: pd.DataFrame) -> None:
+        self._destination.parent.mkdir(parents=True, exist_ok=True)
+        dataframe.to_parquet(
+            self._destination, engine="pyarrow", compression="snappy", index=False
+        )
+
+
+def make_loader(destination: Path) -> Loader:
+    """Factory that picks the loader matching the destination file suffix."""
+
+    if destination.suffix == ".parquet":
+        return ParquetLoader(destination=destination)
+    return CSVLoader(destination=destination)
@@ -1,13 +1,56 @@
 from __future__ import annotations
 
+import gc
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List
 
 import pandas as pd
 
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pyarrow = None
+
+from . import transformers
 from .config import DatasetConfig, ETLConfig
-from .extractors import CSVExtractor
-from .loaders import CSVLoader
+from .extractors import CSVExtractor, make_csv_extractor
+from .loaders import Loader, make_loader
+
+if int(pd.__version__.split(".", 1)[0]) < 3:
+    # pandas 3 always copies on write and deprecates the option.
+    pd.set_option("mode.copy_on_write", True)
+
+ARROW_IO_THREADS = 2
+
+_GC_LOCK = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspends cyclic garbage collection until the outermost paused block exits."""
+
+    global _gc_pause_depth, _gc_was_enabled
+    with _GC_LOCK:
+        if _gc_pause_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+    try:
+        yield
+    finally:
+        with _GC_LOCK:
+            _gc_pause_depth -= 1
+            resume = _gc_pause_depth == 0 and _gc_was_enabled
+            if resume:
+                gc.enable()
+        if resume:
+            gc.collect()
 
 
 @dataclass
@@ -26,16 +69,17 @@ class DatasetPipeline:
         self,
         extractor: CSVExtractor,
         transformations: Iterable[Callable[[pd.DataFrame], pd.DataFrame]],
-        loader: CSVLoader,
+        loader: Loader,
     ) -> None:
         self._extractor = extractor
-        self._transformations = list(transformations)
+        self._transformations = transformers.fuse_transformations(transformations)
         self._loader = loader
 
     def run(self) -> DatasetResult:
-        dataframe = self._extractor.extract()
-        for transformation in self._transformations:
-            dataframe = transformation(dataframe)
+        with _gc_paused():
+            dataframe = self._extractor.extract()
+            for transformation in self._transformations:
+                dataframe = transformation(dataframe)
         self._loader.load(dataframe)
         return DatasetResult(
             dataset_name=self._loader.destination.stem,
@@ -45,21 +89,33 @@ class DatasetPipeline:
 
 
 class ETLPipeline:
-    """Coordinates multiple dataset pipelines end-to-end."""
+    """Coordinates multiple dataset pipelines end-to-end.
+
+    Datasets run on threads, so pyarrow's global CPU pool is split between them to
+    avoid oversubscription. Callers that fan out over processes instead should keep
+    Arrow to a single thread per process.
+    """
 
     def __init__(self, config: ETLConfig) -> None:
         self._config = config
+        if pyarrow is not None:
+            dataset_count = max(1, len(config.dataset_configs))
+            pyarrow.set_cpu_count(max(1, (os.cpu_count() or 1) // dataset_count))
+            pyarrow.set_io_thread_count(ARROW_IO_THREADS)
 
     def run(self) -> Dict[str, DatasetResult]:
-        results: Dict[str, DatasetResult] = {}
-        for dataset_name, dataset_config in self._config.dataset_configs.items():
-            pipeline = self._build_dataset_pipeline(dataset_config)
-            results[dataset_name] = pipeline.run()
-        return results
+        dataset_configs = self._config.dataset_configs
+        max_workers = max(1, min(len(dataset_configs), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Dict[str, Future[DatasetResult]] = {
+                dataset_name: executor.submit(self._build_dataset_pipeline(dataset_config).run)
+                for dataset_name, dataset_config in dataset_configs.items()
+            }
+        return {dataset_name: future.result() for dataset_name, future in futures.items()}
 
     def _build_dataset_pipeline(self, dataset_config: DatasetConfig) -> DatasetPipeline:
-        extractor = CSVExtractor(source=dataset_config.source_path)
-        loader = CSVLoader(destination=dataset_config.output_path)
+        extractor = make_csv_extractor(source=dataset_config.source_path)
+        loader = make_loader(destination=dataset_config.output_path)
         return DatasetPipeline(
             extractor=extractor,
             transformations=dataset_config.transformations,
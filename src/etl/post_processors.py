@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from .transformers import enforce_integer_columns
+
 
 def build_yearly_summary(
     adhesion_by_year: pd.DataFrame,
@@ -12,8 +14,9 @@ def build_yearly_summary(
 ) -> Path:
     """Creates a consolidated yearly summary and stores it as CSV."""
 
-    merged = adhesion_by_year.merge(
-        certification_by_year,
+    merged = pd.merge_ordered(
+        adhesion_by_year.sort_values(by="year"),
+        certification_by_year.sort_values(by="year"),
         on="year",
         how="outer",
         suffixes=("_adhesion", "_certification"),
@@ -26,10 +29,7 @@ def build_yearly_summary(
         "installations_certification",
         "companies_certification",
     ]
-    for column in int_columns:
-        merged[column] = pd.to_numeric(merged[column], errors="coerce").fillna(0).astype(int)
-
-    merged = merged.sort_values(by="year").reset_index(drop=True)
+    merged = enforce_integer_columns(merged, int_columns)
 
     output_path = output_dir / "yearly_summary.csv"
     output_dir.mkdir(parents=True, exist_ok=True)
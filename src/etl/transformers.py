@@ -1,36 +1,49 @@
 from __future__ import annotations
 
+import re
 from typing import Callable, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
 
+_TRANS = str.maketrans({"á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u", "ñ": "n", " ": "_", "-": "_"})
+_COLLAPSE = re.compile(r"_+")
+_INT32 = np.iinfo(np.int32)
+
 
 def drop_completely_empty_columns(dataframe: pd.DataFrame) -> pd.DataFrame:
-    """Removes columns that are entirely empty."""
+    """Removes columns that are entirely empty, returning the frame untouched when there are none."""
 
-    return dataframe.dropna(axis=1, how="all")
+    empty_columns = dataframe.isna().all(axis=0)
+    if not empty_columns.any():
+        return dataframe
+    return dataframe.loc[:, ~empty_columns]
 
 
 def drop_completely_empty_rows(dataframe: pd.DataFrame) -> pd.DataFrame:
-    """Removes rows where all values are missing."""
+    """Removes rows where all values are missing, returning the frame untouched when there are none."""
+
+    empty_rows = dataframe.isna().all(axis=1)
+    if not empty_rows.any():
+        return dataframe
+    return dataframe.loc[~empty_rows]
 
-    return dataframe.dropna(axis=0, how="all")
+
+def _to_snake(columns: pd.Index) -> pd.Index:
+    return (
+        columns.astype(str)
+        .str.strip()
+        .str.lower()
+        .str.translate(_TRANS)
+        .str.replace(_COLLAPSE, "_", regex=True)
+        .str.strip("_")
+    )
 
 
 def standardize_column_names(dataframe: pd.DataFrame) -> pd.DataFrame:
     """Creates snake_case column names without leading or trailing spaces."""
 
-    def to_snake(value: str) -> str:
-        clean_value = value.strip().lower().replace(" ", "_")
-        clean_value = clean_value.replace("-", "_")
-        clean_value = clean_value.replace("á", "a").replace("é", "e").replace("í", "i").replace("ó", "o").replace("ú", "u")
-        clean_value = clean_value.replace("ñ", "n")
-        while "__" in clean_value:
-            clean_value = clean_value.replace("__", "_")
-        return clean_value.strip("_")
-
-    renamed_dataframe = dataframe.rename(columns={column: to_snake(str(column)) for column in dataframe.columns})
-    return renamed_dataframe
+    return dataframe.set_axis(_to_snake(dataframe.columns), axis=1)
 
 
 def filter_rows_with_numeric_column(dataframe: pd.DataFrame, column: str) -> pd.DataFrame:
@@ -40,19 +53,33 @@ def filter_rows_with_numeric_column(dataframe: pd.DataFrame, column: str) -> pd.
     return dataframe.loc[numeric_mask]
 
 
+def _to_integer(series: pd.Series) -> pd.Series:
+    integers = pd.to_numeric(series, errors="coerce").fillna(0).astype("int64")
+    if integers.empty or (integers.min() >= _INT32.min and integers.max() <= _INT32.max):
+        return integers.astype("int32")
+    return integers
+
+
 def enforce_integer_columns(dataframe: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
-    """Casts the selected columns to integer while treating missing values as zero."""
+    """Casts the selected columns to int32 (int64 when needed), treating missing values as zero.
 
-    result = dataframe.copy()
-    for column in columns:
-        result[column] = pd.to_numeric(result[column], errors="coerce").fillna(0).astype(int)
-    return result
+    The input frame is left untouched and its other columns are not deep-copied.
+    """
+
+    return dataframe.assign(**{column: _to_integer(dataframe[column]) for column in columns})
 
 
 def sort_by_column(dataframe: pd.DataFrame, column: str, ascending: bool = True) -> pd.DataFrame:
-    """Sorts the dataframe by the provided column."""
+    """Sorts the dataframe by the provided column, keeping ties in their original order."""
 
-    return dataframe.sort_values(by=column, ascending=ascending).reset_index(drop=True)
+    values = dataframe[column].to_numpy()
+    if values.dtype.kind not in "biu":
+        return dataframe.sort_values(by=column, ascending=ascending).reset_index(drop=True)
+    if ascending:
+        order = np.argsort(values, kind="stable")
+    else:
+        order = values.size - 1 - np.argsort(values[::-1], kind="stable")[::-1]
+    return dataframe.iloc[order].reset_index(drop=True)
 
 
 def make_column_renamer(mapping: dict[str, str]) -> Callable[[pd.DataFrame], pd.DataFrame]:
@@ -61,6 +88,17 @@ def make_column_renamer(mapping: dict[str, str]) -> Callable[[pd.DataFrame], pd.
     def rename(dataframe: pd.DataFrame) -> pd.DataFrame:
         return dataframe.rename(columns=mapping)
 
+    rename.column_mapping = dict(mapping)
+    return rename
+
+
+def make_standardizing_renamer(mapping: dict[str, str]) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Factory that standardizes column names and applies the mapping in a single rename."""
+
+    def rename(dataframe: pd.DataFrame) -> pd.DataFrame:
+        standardized = _to_snake(dataframe.columns)
+        return dataframe.set_axis(standardized.map(lambda name: mapping.get(name, name)), axis=1)
+
     return rename
 
 
@@ -73,14 +111,15 @@ def make_numeric_row_filter(column: str) -> Callable[[pd.DataFrame], pd.DataFram
     return filter_rows
 
 
-def make_integer_enforcer(columns: Iterable[str]) -> Callable[[pd.DataFrame], pd.DataFrame]:
-    """Factory that returns a transformation enforcing integer dtype for the selected columns."""
+def make_integer_enforcer(columns: str | Iterable[str]) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Factory that returns a transformation enforcing integer dtype for one or more columns."""
 
-    selected_columns = tuple(columns)
+    selected_columns = (columns,) if isinstance(columns, str) else tuple(columns)
 
     def enforce(dataframe: pd.DataFrame) -> pd.DataFrame:
         return enforce_integer_columns(dataframe, columns=selected_columns)
 
+    enforce.integer_columns = selected_columns
     return enforce
 
 
@@ -93,15 +132,15 @@ def make_sorter(column: str, ascending: bool = True) -> Callable[[pd.DataFrame],
     return sort
 
 
-def make_integer_column(column: str) -> Callable[[pd.DataFrame], pd.DataFrame]:
-    """Factory that casts a single column to integer."""
+def make_categorical(columns: str | Iterable[str]) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Factory that stores low-cardinality text columns as pandas categoricals."""
+
+    selected_columns = (columns,) if isinstance(columns, str) else tuple(columns)
 
-    def cast(dataframe: pd.DataFrame) -> pd.DataFrame:
-        result = dataframe.copy()
-        result[column] = pd.to_numeric(result[column], errors="coerce").fillna(0).astype(int)
-        return result
+    def categorize(dataframe: pd.DataFrame) -> pd.DataFrame:
+        return dataframe.astype({column: "category" for column in selected_columns})
 
-    return cast
+    return categorize
 
 
 def make_non_null_filter(columns: Sequence[str]) -> Callable[[pd.DataFrame], pd.DataFrame]:
@@ -121,7 +160,33 @@ def make_value_filter(column: str, allowed_values: Sequence[str]) -> Callable[[p
     allowed = {value.lower(): value for value in allowed_values}
 
     def filter_values(dataframe: pd.DataFrame) -> pd.DataFrame:
-        mask = dataframe[column].astype(str).str.lower().isin(allowed)
+        categorical = pd.Categorical(dataframe[column])
+        matching = categorical.categories.astype(str).str.lower().isin(allowed)
+        mask = np.isin(categorical.codes, np.flatnonzero(matching))
         return dataframe.loc[mask]
 
     return filter_values
+
+
+def fuse_transformations(
+    transformations: Iterable[Callable[[pd.DataFrame], pd.DataFrame]],
+) -> list[Callable[[pd.DataFrame], pd.DataFrame]]:
+    """Merges adjacent steps that can share a single pass over the dataframe.
+
+    Consecutive integer casts become one enforcer and a column renamer that follows
+    standardize_column_names is folded into a single rename.
+    """
+
+    fused: list[Callable[[pd.DataFrame], pd.DataFrame]] = []
+    for transformation in transformations:
+        previous = fused[-1] if fused else None
+        integer_columns = getattr(transformation, "integer_columns", None)
+        if integer_columns is not None and hasattr(previous, "integer_columns"):
+            fused[-1] = make_integer_enforcer([*previous.integer_columns, *integer_columns])
+            continue
+        column_mapping = getattr(transformation, "column_mapping", None)
+        if column_mapping is not None and previous is standardize_column_names:
+            fused[-1] = make_standardizing_renamer(column_mapping)
+            continue
+        fused.append(transformation)
+    return fused
@@ -28,9 +28,11 @@ class RequiredColumnsValidator(DataValidator):
 
     def __init__(self, expected_columns: Iterable[str]) -> None:
         self._expected_columns = tuple(expected_columns)
+        self._expected_set = frozenset(self._expected_columns)
 
     def validate(self, dataframe: pd.DataFrame) -> None:
-        missing_columns = [column for column in self._expected_columns if column not in dataframe.columns]
-        if missing_columns:
+        missing = self._expected_set.difference(dataframe.columns)
+        if missing:
+            missing_columns = [column for column in self._expected_columns if column in missing]
             message = f"Missing required columns: {missing_columns}"
             raise ValueError(message)